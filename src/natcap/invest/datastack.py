@@ -28,6 +28,8 @@ import pprint
 import collections
 import re
 import ast
+import subprocess
+import uuid
 import warnings
 
 from osgeo import gdal
@@ -45,6 +47,14 @@ except ImportError:
         '__version__ attribute of natcap.invest could not be imported.',
         RuntimeWarning)
 
+# When both a system tar and pigz are available, datastack archives are
+# written by piping tar into pigz, keeping the work out of the interpreter.
+_TAR_PATH = shutil.which('tar')
+_PIGZ_PATH = shutil.which('pigz')
+# tarfile streams in 10KiB records and copies member data in 16KiB chunks by
+# default, which means many small reads and writes for large rasters.
+_TAR_BUFSIZE = 2 * 1024 * 1024
+
 
 LOGGER = logging.getLogger(__name__)
 ARGS_LOG_LEVEL = 100  # define high log level so it should always show in logs
@@ -272,12 +282,19 @@ def get_datastack_info(filepath):
     """
     if tarfile.is_tarfile(filepath):
         # If it's a tarfile, we need to extract the parameters file to be able
-        # to inspect the parameters and model details.
-        with tarfile.open(filepath) as archive:
+        # to inspect the parameters and model details.  Reading the archive
+        # as a stream lets us stop as soon as the parameters file is found
+        # instead of decompressing the whole archive to index its members.
+        with tarfile.open(filepath, 'r|*') as archive:
             try:
                 temp_directory = tempfile.mkdtemp()
-                archive.extract('./' + DATASTACK_PARAMETER_FILENAME,
-                                temp_directory)
+                for member in archive:
+                    if member.name == './' + DATASTACK_PARAMETER_FILENAME:
+                        archive.extract(member, temp_directory)
+                        break
+                else:
+                    raise KeyError('filename %r not found' % (
+                        './' + DATASTACK_PARAMETER_FILENAME))
                 return 'archive', extract_parameter_set(
                     os.path.join(temp_directory, DATASTACK_PARAMETER_FILENAME))
             finally:
@@ -289,11 +306,17 @@ def get_datastack_info(filepath):
                     # execution.
                     LOGGER.exception('Could not remove %s', temp_directory)
 
-    try:
-        return 'json', extract_parameter_set(filepath)
-    except ValueError:
-        # When a JSON object can't be decoded, it must not be a paramset.
-        pass
+    # A parameter set is a JSON object, so it starts with '{' (possibly after
+    # a byte-order mark or whitespace).  Checking this first avoids parsing a
+    # whole logfile as JSON just to find out that it isn't.
+    with open(filepath, 'rb') as opened_file:
+        file_head = opened_file.read(64)
+    if file_head.lstrip(codecs.BOM_UTF8).lstrip().startswith(b'{'):
+        try:
+            return 'json', extract_parameter_set(filepath)
+        except ValueError:
+            # When a JSON object can't be decoded, it must not be a paramset.
+            pass
 
     return 'logfile', extract_parameters_from_logfile(filepath)
 
@@ -380,8 +403,9 @@ def build_datastack_archive(args, model_name, datastack_path):
             'invest_version': __version__
         }
 
-    LOGGER.debug('found files: \n%s', pprint.pformat(files_found))
-    LOGGER.debug('new arguments: \n%s', pprint.pformat(new_args))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug('found files: \n%s', pprint.pformat(files_found))
+        LOGGER.debug('new arguments: \n%s', pprint.pformat(new_args))
     # write parameters to a new json file in the temp workspace
     param_file_uri = os.path.join(temp_workspace,
                                   'parameters' + PARAMETER_SET_EXTENSION)
@@ -390,13 +414,79 @@ def build_datastack_archive(args, model_name, datastack_path):
                                 indent=4,
                                 sort_keys=True))
 
-    # archive the workspace.
-    with utils.sandbox_tempdir() as temp_dir:
-        temp_archive = os.path.join(temp_dir, 'invest_archive')
-        archive_name = shutil.make_archive(
-            temp_archive, 'gztar', root_dir=temp_workspace,
-            logger=LOGGER, verbose=True)
-        shutil.move(archive_name, datastack_path)
+    # archive the workspace.  The archive is streamed to a temporary file in
+    # the destination folder and only moved over datastack_path once it is
+    # complete, so a failed write never clobbers an existing datastack.
+    LOGGER.info('Writing datastack archive to %s', datastack_path)
+    temp_archive_path = '%s.%s.tmp' % (
+        os.path.abspath(datastack_path), uuid.uuid4().hex)
+    try:
+        _write_archive(temp_workspace, temp_archive_path)
+        os.replace(temp_archive_path, datastack_path)
+    except BaseException:
+        if os.path.exists(temp_archive_path):
+            os.remove(temp_archive_path)
+        raise
+
+
+def _write_archive(source_dir, archive_path):
+    """Write the contents of a directory to a gzipped tar archive.
+
+    Members are stored relative to ``source_dir`` (rooted at ``.``).  The
+    datastack parameter set, if present, is always the first member so that
+    it can be read without decompressing the rest of the archive.  The
+    fastest available tool is used: system ``tar`` piped into ``pigz`` if
+    both are installed, otherwise python's ``tarfile`` with its built-in gzip
+    support.  Either way the result is a single gzip member, which is what
+    ``tarfile``'s stream reader expects.
+
+    Args:
+        source_dir (string): The directory whose contents should be archived.
+        archive_path (string): The path to where the archive should be
+            written.
+
+    Returns:
+        ``None``
+    """
+    # sorted() is stable, so only the parameter set is moved to the front.
+    member_names = sorted(
+        os.listdir(source_dir),
+        key=lambda name: name != DATASTACK_PARAMETER_FILENAME)
+    arcnames = [os.curdir + '/' + name for name in member_names]
+
+    if _TAR_PATH and _PIGZ_PATH:
+        with open(archive_path, 'wb') as archive_file:
+            # COPYFILE_DISABLE keeps macOS bsdtar from adding ./._* members
+            # for extended attributes.
+            tar_process = subprocess.Popen(
+                [_TAR_PATH, '-C', source_dir, '-cf', '-'] + arcnames,
+                stdout=subprocess.PIPE,
+                env=dict(os.environ, COPYFILE_DISABLE='1'))
+            try:
+                pigz_process = subprocess.Popen(
+                    [_PIGZ_PATH, '-p', str(os.cpu_count() or 1)],
+                    stdin=tar_process.stdout, stdout=archive_file)
+            except BaseException:
+                tar_process.kill()
+                tar_process.stdout.close()
+                tar_process.wait()
+                raise
+            # Allow tar to receive SIGPIPE if pigz exits early.
+            tar_process.stdout.close()
+            pigz_returncode = pigz_process.wait()
+            tar_returncode = tar_process.wait()
+        if tar_returncode or pigz_returncode:
+            raise RuntimeError(
+                'Could not write archive %s (tar exited with %s, pigz '
+                'exited with %s)' % (
+                    archive_path, tar_returncode, pigz_returncode))
+    else:
+        with tarfile.open(archive_path, 'w|gz',
+                          bufsize=_TAR_BUFSIZE) as archive:
+            archive.copybufsize = _TAR_BUFSIZE
+            for member_name, arcname in zip(member_names, arcnames):
+                archive.add(os.path.join(source_dir, member_name),
+                            arcname=arcname)
 
 
 def extract_datastack_archive(datastack_path, dest_dir_path):
@@ -413,8 +503,13 @@ def extract_datastack_archive(datastack_path, dest_dir_path):
             archive.  Paths to files are absolute paths.
     """
     LOGGER.info('Extracting archive %s to %s', datastack_path, dest_dir_path)
-    # extract the archive to the workspace
-    with tarfile.open(datastack_path) as tar:
+    # extract the archive to the workspace.  Reading the archive as a stream
+    # extracts each member as it is decompressed, without seeking back
+    # through the compressed file.  extractall() also sets directory
+    # permissions and modification times only after their contents are in
+    # place.
+    with tarfile.open(datastack_path, 'r|*', bufsize=_TAR_BUFSIZE) as tar:
+        tar.copybufsize = _TAR_BUFSIZE
         tar.extractall(dest_dir_path)
 
     # get the arguments dictionary
@@ -445,7 +540,8 @@ def extract_datastack_archive(datastack_path, dest_dir_path):
         return args_param
 
     new_args = _rewrite_paths(arguments_dict)
-    LOGGER.debug('Expanded parameters as \n%s', pprint.pformat(new_args))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug('Expanded parameters as \n%s', pprint.pformat(new_args))
     return new_args
 
 
@@ -1313,7 +1313,6 @@ def _create_rasters_from_geometries(
 
         # Add geometries to the layer
         temp_layer.StartTransaction()
-        temp_feat = temp_layer.GetNextFeature()
         temp_feat = ogr.Feature(layer_defn)
         temp_feat.SetGeometry(geom)
         temp_layer.CreateFeature(temp_feat)
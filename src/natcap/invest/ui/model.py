@@ -43,7 +43,20 @@ STATUSBAR_MSG_DURATION = 10000
 ICON_BACK = qtawesome.icon('fa.arrow-circle-o-left', color='grey')
 ICON_ALERT = qtawesome.icon('fa.exclamation-triangle', color='orange')
 ICON_UPDATE = qtawesome.icon('fa.refresh', color='orange')
-
+ICON_QUESTION = qtawesome.icon('fa.question')
+ICON_CANCEL = qtawesome.icon('fa.times', color='grey')
+ICON_INVALID = qtawesome.icon('fa.times', color='red')
+ICON_SETTINGS = qtawesome.icon('fa.cog')
+ICON_SAVE = qtawesome.icon('fa.floppy-o')
+ICON_OPEN = qtawesome.icon('fa.folder-open-o')
+ICON_LOAD = qtawesome.icon('fa.arrow-circle-o-up')
+ICON_CLEAR = qtawesome.icon('fa.undo', color='red')
+ICON_TRASH = qtawesome.icon('fa.trash-o')
+ICON_SCRIPT = qtawesome.icon('fa.file-code-o')
+ICON_INFO = qtawesome.icon('fa.info')
+ICON_EXTERNAL_LINK = qtawesome.icon('fa.external-link')
+
+_DOCUMENTS_DIR = os.path.expanduser(os.path.join('~', 'Documents'))
 _ONLINE_DOCS_LINK = (
     'http://releases.naturalcapitalproject.org/invest-userguide/latest/')
 _DATASTACK_BASE_FILENAME = 'datastack.invest.%s'
@@ -60,6 +73,61 @@ _DATASTACK_SAVE_OPTS = {
         'savefile': _DATASTACK_BASE_FILENAME % 'tar.gz',
     }
 }
+_VALIDATION_WARNING_ITEM = '<li><b>{}</b>: {}</li>'.format
+# (project, license, homepage) for the open-source components listed in the
+# About dialog.
+_ABOUT_LICENSES = (
+    ('PyInstaller', 'GPL', 'http://pyinstaller.org'),
+    ('GDAL', 'MIT and others', 'http://gdal.org'),
+    ('numpy', 'BSD', 'http://numpy.org'),
+    ('pyamg', 'BSD', 'http://github.com/pyamg/pyamg'),
+    ('pygeoprocessing', 'BSD',
+     'https://github.com/natcap/pygeoprocessing'),
+    ('PyQt', 'GPL',
+     'https://riverbankcomputing.com/software/pyqt/intro'),
+    ('rtree', 'LGPL', 'http://toblerity.org/rtree/'),
+    ('scipy', 'BSD', 'http://www.scipy.org/'),
+    ('shapely', 'BSD', 'http://github.com/Toblerity/Shapely'),
+)
+# The About dialog's content never changes, so it is rendered once here
+# rather than every time a model window is built.
+_ABOUT_HTML = ''.join([
+    textwrap.dedent(
+        """
+        <h1>InVEST</h1>
+        <b>Version {version}</b> <br/> <br/>
+
+        Documentation: <a href="http://releases.naturalcapitalproject.org/
+        invest-userguide/latest/">online</a><br/>
+        Homepage: <a href="http://naturalcapitalproject.org">
+                    naturalcapitalproject.org</a><br/>
+        Copyright 2017, The Natural Capital Project<br/>
+        License:
+        <a href="https://github.com/natcap/invest/blob/master/LICENSE.txt">
+                    BSD 3-clause</a><br/>
+        Project page: <a href="https://github.com/natcap/invest">
+                    github.com/natcap/invest</a><br/>
+
+        <h2>Open-Source Licenses</h2>
+        """.format(version=natcap.invest.__version__)),
+    '<table>',
+    ''.join([
+        ('<tr>'
+         '<td>{project}  </td>'
+         '<td><a href="licenses/{project}_license.txt">{license}</a>  </td>'
+         '<td><a href="{homepage}">{homepage}</a>  </td></tr/>').format(
+             project=lib_name, license=lib_license, homepage=lib_homepage)
+        for lib_name, lib_license, lib_homepage in _ABOUT_LICENSES]),
+    '</table>',
+    textwrap.dedent(
+        """
+        <br/>
+        <p>
+        The source code for GPL'd components are included as an extra
+        component on your <br/> installation medium.
+        </p>
+        """),
+])
 # To create a QSettings object, call this with the model label as the only
 # argument.  Example:  settings = SETTINGS_TEMPLATE('My Model')
 SETTINGS_TEMPLATE = functools.partial(
@@ -71,16 +139,29 @@ SETTINGS_TEMPLATE = functools.partial(
 def wait_on_signal(signal, timeout=250):
     """Block loop until signal emitted, or timeout (ms) elapses."""
     loop = QtCore.QEventLoop()
-    signal.connect(loop.quit)
+    # If the signal is emitted synchronously within the body of the with
+    # block, loop.quit() is called before the loop is running and would be
+    # a no-op, so track the emission and skip the loop entirely.
+    signal_emitted = []
+
+    def _quit_loop(*args):
+        signal_emitted.append(True)
+        loop.quit()
+
+    signal.connect(_quit_loop)
+    timer = QtCore.QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)
 
     try:
         yield
-        if QT_APP.hasPendingEvents():
-            QT_APP.processEvents()
     finally:
-        if timeout is not None:
-            QtCore.QTimer.singleShot(timeout, loop.quit)
-        loop.exec_()
+        if not signal_emitted:
+            if timeout is not None:
+                timer.start(timeout)
+            loop.exec_()
+        timer.stop()
+        signal.disconnect(_quit_loop)
     loop = None
 
 
@@ -131,6 +212,27 @@ def is_probably_datastack(filepath):
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _default_cache_dir():
+    """Look up the platform's default cache directory.
+
+    The lookup is done once and then cached.  It is deferred until first use
+    because the location depends on the application's name, which is only
+    known once the QApplication has been created.
+
+    Returns:
+        The string path to the default cache directory.
+    """
+    try:
+        # Qt4
+        return QtGui.QDesktopServices.storageLocation(
+            QtGui.QDesktopServices.CacheLocation)
+    except AttributeError:
+        # Package location changed in Qt5
+        return QtCore.QStandardPaths.writableLocation(
+            QtCore.QStandardPaths.CacheLocation)
+
+
 class OptionsDialog(QtWidgets.QDialog):
     """A common dialog class for Options-style functionality.
 
@@ -180,8 +282,7 @@ class OptionsDialog(QtWidgets.QDialog):
         self.ok_button.setIcon(inputs.ICON_ENTER)
         self.ok_button.clicked.connect(self.accept)
         self.cancel_button = QtWidgets.QPushButton(self._reject_text)
-        self.cancel_button.setIcon(qtawesome.icon('fa.times',
-                                                  color='grey'))
+        self.cancel_button.setIcon(ICON_CANCEL)
         self.cancel_button.clicked.connect(self.reject)
 
         self.finished.connect(self._call_postprocess)
@@ -262,9 +363,7 @@ class QuitConfirmDialog(QtWidgets.QMessageBox):
         self.setStandardButtons(
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
         self.setDefaultButton(QtWidgets.QMessageBox.Cancel)
-        self.setIconPixmap(
-            qtawesome.icon(
-                'fa.question').pixmap(100, 100))
+        self.setIconPixmap(ICON_QUESTION.pixmap(100, 100))
         self.checkbox = QtWidgets.QCheckBox('Remember inputs')
         self.layout().addWidget(self.checkbox,
                                 self.layout().rowCount()-1,
@@ -384,14 +483,7 @@ class SettingsDialog(OptionsDialog):
         self._global_opts_container = inputs.Container(label='Global options')
         self.layout().addWidget(self._global_opts_container)
 
-        try:
-            # Qt4
-            cache_dir = QtGui.QDesktopServices.storageLocation(
-                QtGui.QDesktopServices.CacheLocation)
-        except AttributeError:
-            # Package location changed in Qt5
-            cache_dir = QtCore.QStandardPaths.writableLocation(
-                QtCore.QStandardPaths.CacheLocation)
+        cache_dir = _default_cache_dir()
         self.cache_directory = inputs.Folder(
             label='Cache directory',
             helptext=('Where local files will be stored.'
@@ -522,62 +614,7 @@ class AboutDialog(QtWidgets.QDialog):
         QtWidgets.QDialog.__init__(self, parent=parent)
         self.setWindowTitle('About InVEST')
         self.setLayout(QtWidgets.QVBoxLayout())
-        label_text = textwrap.dedent(
-            """
-            <h1>InVEST</h1>
-            <b>Version {version}</b> <br/> <br/>
-
-            Documentation: <a href="http://releases.naturalcapitalproject.org/
-            invest-userguide/latest/">online</a><br/>
-            Homepage: <a href="http://naturalcapitalproject.org">
-                        naturalcapitalproject.org</a><br/>
-            Copyright 2017, The Natural Capital Project<br/>
-            License:
-            <a href="https://github.com/natcap/invest/blob/master/LICENSE.txt">
-                        BSD 3-clause</a><br/>
-            Project page: <a href="https://github.com/natcap/invest">
-                        github.com/natcap/invest</a><br/>
-
-            <h2>Open-Source Licenses</h2>
-            """.format(
-                version=natcap.invest.__version__))
-
-        label_text += "<table>"
-        for lib_name, lib_license, lib_homepage in [
-                ('PyInstaller', 'GPL', 'http://pyinstaller.org'),
-                ('GDAL', 'MIT and others', 'http://gdal.org'),
-                ('numpy', 'BSD', 'http://numpy.org'),
-                ('pyamg', 'BSD', 'http://github.com/pyamg/pyamg'),
-                ('pygeoprocessing', 'BSD',
-                 'https://github.com/natcap/pygeoprocessing'),
-                ('PyQt', 'GPL',
-                 'https://riverbankcomputing.com/software/pyqt/intro'),
-                ('rtree', 'LGPL', 'http://toblerity.org/rtree/'),
-                ('scipy', 'BSD', 'http://www.scipy.org/'),
-                ('shapely', 'BSD', 'http://github.com/Toblerity/Shapely')]:
-            label_text += (
-                '<tr>'
-                '<td>{project}  </td>'
-                '<td>{license}  </td>'
-                '<td>{homepage}  </td></tr/>').format(
-                    project=lib_name,
-                    license=(
-                        '<a href="licenses/{project}_license.txt">'
-                        '{license}</a>').format(project=lib_name,
-                                                license=lib_license),
-                    homepage='<a href="{0}">{0}</a>'.format(lib_homepage))
-
-        label_text += "</table>"
-        label_text += textwrap.dedent(
-            """
-            <br/>
-            <p>
-            The source code for GPL'd components are included as an extra
-            component on your <br/> installation medium.
-            </p>
-            """)
-
-        self.label = QtWidgets.QLabel(label_text)
+        self.label = QtWidgets.QLabel(_ABOUT_HTML)
         self.label.setTextFormat(QtCore.Qt.RichText)
         self.label.setOpenExternalLinks(True)
         self.layout().addWidget(self.label)
@@ -617,10 +654,7 @@ class LocalDocsMissingDialog(QtWidgets.QMessageBox):
             '<br/><br/>Local documentation link could not be found: %s' %
             (remote_link, local_docs_link))
         self.setStandardButtons(QtWidgets.QMessageBox.Ok)
-        self.setIconPixmap(
-            qtawesome.icon(
-                'fa.exclamation-triangle',
-                color='orange').pixmap(100, 100))
+        self.setIconPixmap(ICON_ALERT.pixmap(100, 100))
 
 
 class WindowTitle(QtCore.QObject):
@@ -667,41 +701,64 @@ class WindowTitle(QtCore.QObject):
         """
         super(WindowTitle, self).__init__()
 
-        self.modelname = modelname
-        self.filename = filename
-        self.modified = modified
-
         # Python strings are immutable; this can be accessed like an instance
         # variable.
         self._format_string = "{modelname}: {filename}{modified}"
 
-    def set_title_attr(self, name, value):
-        """Attribute setter.
+        self._modelname = modelname
+        self._filename = filename
+        self._modified = modified
+        self._title = repr(self)
 
-        Set the given attribute and emit the ``title_changed`` signal with
-        the new window title if the rendered title is different from the
-        previous title.
+    @property
+    def modelname(self):
+        """The name of the model in the window title."""
+        return self._modelname
 
-        Args:
-            name (string): the name of the attribute to set.
-            value: The new value for the attribute.
+    @modelname.setter
+    def modelname(self, value):
+        if value == self._modelname:
+            return
+        self._modelname = value
+        self._emit_title()
+
+    @property
+    def filename(self):
+        """The datastack filename in the window title."""
+        return self._filename
+
+    @filename.setter
+    def filename(self, value):
+        if value == self._filename:
+            return
+        self._filename = value
+        self._emit_title()
+
+    @property
+    def modified(self):
+        """Whether the datastack has been modified."""
+        return self._modified
+
+    @modified.setter
+    def modified(self, value):
+        if value == self._modified:
+            return
+        self._modified = value
+        self._emit_title()
+
+    def _emit_title(self):
+        """Emit ``title_changed`` if the rendered title has changed.
+
+        Returns:
+            ``None``
         """
-        LOGGER.info('__setattr__: %s, %s', name, value)
-        old_attr = getattr(self, name, 'None')
-        # Python Core and Builtins were updated in Python 3.8.4
-        # that handle __setattr__ differently. In 3.7, the super()
-        # implementation causes a `TypeError: can't apply this __setattr__
-        # to object object` when running `invest run carbon`. In Python 3.8.4+
-        # with the object implementation the error `TypeError: can't apply 
-        # this __setattr__ to Carbon object` 
-        if (sys.version_info.minor >= 8) and (sys.version_info.micro >= 4):
-            super().__setattr__(name, value)
-        else:
-            object.__setattr__(self, name, value)
-        if old_attr != value:
-            new_value = repr(self)
-            LOGGER.info('Emitting new title %s', new_value)
-            self.title_changed.emit(new_value)
+        new_title = repr(self)
+        if new_title == self._title:
+            return
+        self._title = new_title
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Emitting new title %s', new_title)
+        self.title_changed.emit(new_title)
 
     def __repr__(self):
         """Produce a string representation of the window title.
@@ -709,13 +766,10 @@ class WindowTitle(QtCore.QObject):
         Returns:
             The string wundow title.
         """
-        try:
-            return self._format_string.format(
-                modelname=self.modelname if self.modelname else 'InVEST',
-                filename=self.filename if self.filename else 'new datastack',
-                modified='*' if self.modified else '')
-        except AttributeError:
-            return ''
+        return self._format_string.format(
+            modelname=self._modelname if self._modelname else 'InVEST',
+            filename=self._filename if self._filename else 'new datastack',
+            modified='*' if self._modified else '')
 
 
 DatastackSaveOpts = collections.namedtuple(
@@ -764,6 +818,14 @@ class DatastackOptionsDialog(OptionsDialog):
         self.layout().addWidget(self._container)
         self.paramset_basename = paramset_basename
 
+        # The savefile for each datastack type only depends on the basename,
+        # so format them once rather than on every dropdown change.
+        self._savefiles = dict(
+            (datastack_type, '{model}_{file_base}'.format(
+                model=self.paramset_basename,
+                file_base=save_opts['savefile']))
+            for datastack_type, save_opts in _DATASTACK_SAVE_OPTS.items())
+
         self.datastack_type = inputs.Dropdown(
             label='Datastack type',
             options=sorted(_DATASTACK_SAVE_OPTS.keys()))
@@ -777,10 +839,7 @@ class DatastackOptionsDialog(OptionsDialog):
         self.save_parameters = inputs.SaveFile(
             label=_DATASTACK_SAVE_OPTS[_DATASTACK_PARAMETER_SET]['title'],
             args_key='archive_path',
-            default_savefile='{model}_{file_base}'.format(
-                model=self.paramset_basename,
-                file_base=_DATASTACK_SAVE_OPTS[
-                    _DATASTACK_PARAMETER_SET]['savefile']))
+            default_savefile=self._savefiles[_DATASTACK_PARAMETER_SET])
 
         self._container.add_input(self.datastack_type)
         self._container.add_input(self.use_relative_paths)
@@ -808,9 +867,7 @@ class DatastackOptionsDialog(OptionsDialog):
 
             self.save_parameters.path_select_button.set_dialog_options(
                 title=_DATASTACK_SAVE_OPTS[value]['title'],
-                savefile='{model}_{file_base}'.format(
-                    model=self.paramset_basename,
-                    file_base=_DATASTACK_SAVE_OPTS[value]['savefile']))
+                savefile=self._savefiles[value])
 
         @QtCore.Slot(bool)
         def _enable_continue_button(new_value):
@@ -1087,9 +1144,9 @@ class WholeModelValidationErrorDialog(QtWidgets.QDialog):
                 'erorrs:</h4>')
             self.label.setText(
                 '<ul>%s</ul>' % ''.join(
-                    ['<li><b>%s</b>: %s</li>' % (
+                    _VALIDATION_WARNING_ITEM(
                         ', '.join(labels), html.escape(warning_))
-                     for labels, warning_ in validation_warnings]))
+                    for labels, warning_ in validation_warnings))
             self.label.repaint()
             self.label.setVisible(True)
 
@@ -1174,46 +1231,46 @@ class InVESTModel(QtWidgets.QMainWindow):
         self.localdoc = localdoc
 
         self.inputs = set([])
+        # args_key -> input registries, kept up to date by __setattr__.
+        self._inputs_by_args_key = {}
+        self._gridded_inputs = {}
+        # assemble_args() is cached until any input's value changes.
+        self._args_cache = None
+        # See suppress_validation()
+        self._validation_suppressed = False
+        self._validation_requested = False
 
         self.setAcceptDrops(True)
         self._quickrun = False
         self._validator = inputs.Validator(parent=self)
         self._validator.finished.connect(self._validation_finished)
+        # Validation triggered by input changes is debounced so that a burst
+        # of changes (e.g. typing) results in a single validation.
+        self._validate_timer = QtCore.QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(
+            lambda: self.validate(block=False))
         self.prompt_on_close = True
         self.exit_code = None
 
         # dialogs
-        self.about_dialog = AboutDialog(parent=self)
-        self.settings_dialog = SettingsDialog(parent=self)
+        # Most dialogs are only needed when the user opens a menu item or
+        # hits an edge case, so they are built on first access through the
+        # properties below.  The validation report is used on every
+        # validation pass, so it is always built.
         self.file_dialog = inputs.FileDialog(parent=self)
-        self.datastack_progress_dialog = DatastackProgressDialog(parent=self)
-
-        paramset_basename = self.target.__module__.split('.')[-1]
-        self.datastack_options_dialog = DatastackOptionsDialog(
-            paramset_basename=paramset_basename, parent=self)
-        self.datastack_archive_extract_dialog = (
-            DatastackArchiveExtractionDialog(parent=self))
-
-        self.quit_confirm_dialog = QuitConfirmDialog(self)
         self.validation_report_dialog = WholeModelValidationErrorDialog(self)
-        self.local_docs_missing_dialog = LocalDocsMissingDialog(self.localdoc,
-                                                                parent=self)
-        self.input_overwrite_confirm_dialog = ConfirmDialog(
-            title_text='Overwrite parameters?',
-            body_text=('Loading a datastack will overwrite any unsaved '
-                       'parameters. Are you sure you want to continue?'),
-            parent=self)
-        self.workspace_overwrite_confirm_dialog = ConfirmDialog(
-            title_text='Workspace exists!',
-            body_text='Overwrite files from a previous run?',
-            parent=self)
-        self.model_mismatch_confirm_dialog = ModelMismatchConfirmDialog(
-            self.target.__module__, parent=self)
-
-        def _settings_saved_message():
-            self.statusBar().showMessage('Settings saved',
-                                         STATUSBAR_MSG_DURATION)
-        self.settings_dialog.accepted.connect(_settings_saved_message)
+        self._about_dialog = None
+        self._settings_dialog = None
+        self._datastack_progress_dialog = None
+        self._datastack_options_dialog = None
+        self._datastack_archive_extract_dialog = None
+        self._quit_confirm_dialog = None
+        self._local_docs_missing_dialog = None
+        self._input_overwrite_confirm_dialog = None
+        self._workspace_overwrite_confirm_dialog = None
+        self._model_mismatch_confirm_dialog = None
 
         # Main operational widgets for the form
         self._central_widget = QtWidgets.QWidget(parent=self)
@@ -1228,7 +1285,7 @@ class InVESTModel(QtWidgets.QMainWindow):
 
         self.window_title = WindowTitle()
         self.window_title.title_changed.connect(self.setWindowTitle)
-        self.window_title.set_title_attr('modelname', self.label)
+        self.window_title.modelname = self.label
 
         # Add InVEST version update button and links at the top of the window.
         self.links_layout = QtWidgets.QHBoxLayout()
@@ -1271,10 +1328,12 @@ class InVESTModel(QtWidgets.QMainWindow):
                                        validator=self.validator)
 
         # natcap.invest.pollination.pollination --> pollination
+        # The default workspace is only set when the window is first shown,
+        # and only if no workspace was loaded (e.g. from the last run) and
+        # nothing has filled it in by then.  See load_args().
         modelname = self.target.__module__.split('.')[-1]
-        self.workspace.set_value(os.path.normpath(
-            os.path.expanduser('~/Documents/{model}_workspace').format(
-                model=modelname)))
+        self._default_workspace = os.path.normpath(os.path.join(
+            _DOCUMENTS_DIR, '{model}_workspace'.format(model=modelname)))
 
         self.suffix = inputs.Text(
             args_key='results_suffix',
@@ -1296,15 +1355,15 @@ class InVESTModel(QtWidgets.QMainWindow):
         # Menu items.
         self.file_menu = QtWidgets.QMenu('&File', parent=self)
         self.file_menu.addAction(
-            qtawesome.icon('fa.cog'),
-            'Settings ...', self.settings_dialog.exec_,
+            ICON_SETTINGS,
+            'Settings ...', lambda: self.settings_dialog.exec_(),
             QtGui.QKeySequence(QtGui.QKeySequence.Preferences))
         self.file_menu.addAction(
-            qtawesome.icon('fa.floppy-o'),
+            ICON_SAVE,
             'Save as ...', self._save_datastack_as,
             QtGui.QKeySequence(QtGui.QKeySequence.SaveAs))
         self.open_menu = QtWidgets.QMenu('Load parameters', parent=self)
-        self.open_menu.setIcon(qtawesome.icon('fa.folder-open-o'))
+        self.open_menu.setIcon(ICON_OPEN)
         self.build_open_menu()
         self.file_menu.addMenu(self.open_menu)
 
@@ -1315,30 +1374,118 @@ class InVESTModel(QtWidgets.QMainWindow):
 
         self.edit_menu = QtWidgets.QMenu('&Edit', parent=self)
         self.edit_menu.addAction(
-            qtawesome.icon('fa.undo', color='red'),
+            ICON_CLEAR,
             'Clear inputs', self.clear_inputs)
         self.edit_menu.addAction(
-            qtawesome.icon('fa.trash-o'),
+            ICON_TRASH,
             'Clear parameter cache for %s' % self.label,
             self.clear_local_settings)
         self.menuBar().addMenu(self.edit_menu)
 
         self.dev_menu = QtWidgets.QMenu('&Development', parent=self)
         self.dev_menu.addAction(
-            qtawesome.icon('fa.file-code-o'),
+            ICON_SCRIPT,
             'Save to python script ...', self.save_to_python)
         self.menuBar().addMenu(self.dev_menu)
 
         self.help_menu = QtWidgets.QMenu('&Help', parent=self)
         self.help_menu.addAction(
-            qtawesome.icon('fa.info'),
-            'About InVEST', self.about_dialog.exec_)
+            ICON_INFO,
+            'About InVEST', lambda: self.about_dialog.exec_())
         self.help_menu.addAction(
-            qtawesome.icon('fa.external-link'),
+            ICON_EXTERNAL_LINK,
             'View documentation', self._check_local_docs,
             QtGui.QKeySequence(QtGui.QKeySequence.HelpContents))
         self.menuBar().addMenu(self.help_menu)
 
+    @property
+    def about_dialog(self):
+        """The ``AboutDialog`` for this window, built on first access."""
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(parent=self)
+        return self._about_dialog
+
+    @property
+    def settings_dialog(self):
+        """The ``SettingsDialog`` for this window, built on first access."""
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(parent=self)
+
+            def _settings_saved_message():
+                self.statusBar().showMessage('Settings saved',
+                                             STATUSBAR_MSG_DURATION)
+            self._settings_dialog.accepted.connect(_settings_saved_message)
+        return self._settings_dialog
+
+    @property
+    def datastack_progress_dialog(self):
+        """The ``DatastackProgressDialog``, built on first access."""
+        if self._datastack_progress_dialog is None:
+            self._datastack_progress_dialog = DatastackProgressDialog(
+                parent=self)
+        return self._datastack_progress_dialog
+
+    @property
+    def datastack_options_dialog(self):
+        """The ``DatastackOptionsDialog``, built on first access."""
+        if self._datastack_options_dialog is None:
+            paramset_basename = self.target.__module__.split('.')[-1]
+            self._datastack_options_dialog = DatastackOptionsDialog(
+                paramset_basename=paramset_basename, parent=self)
+        return self._datastack_options_dialog
+
+    @property
+    def datastack_archive_extract_dialog(self):
+        """The ``DatastackArchiveExtractionDialog``, built on first access."""
+        if self._datastack_archive_extract_dialog is None:
+            self._datastack_archive_extract_dialog = (
+                DatastackArchiveExtractionDialog(parent=self))
+        return self._datastack_archive_extract_dialog
+
+    @property
+    def quit_confirm_dialog(self):
+        """The ``QuitConfirmDialog``, built on first access."""
+        if self._quit_confirm_dialog is None:
+            self._quit_confirm_dialog = QuitConfirmDialog(self)
+        return self._quit_confirm_dialog
+
+    @property
+    def local_docs_missing_dialog(self):
+        """The ``LocalDocsMissingDialog``, built on first access."""
+        if self._local_docs_missing_dialog is None:
+            self._local_docs_missing_dialog = LocalDocsMissingDialog(
+                self.localdoc, parent=self)
+        return self._local_docs_missing_dialog
+
+    @property
+    def input_overwrite_confirm_dialog(self):
+        """Confirm overwriting inputs with a datastack, built on access."""
+        if self._input_overwrite_confirm_dialog is None:
+            self._input_overwrite_confirm_dialog = ConfirmDialog(
+                title_text='Overwrite parameters?',
+                body_text=('Loading a datastack will overwrite any unsaved '
+                           'parameters. Are you sure you want to continue?'),
+                parent=self)
+        return self._input_overwrite_confirm_dialog
+
+    @property
+    def workspace_overwrite_confirm_dialog(self):
+        """Confirm overwriting an existing workspace, built on access."""
+        if self._workspace_overwrite_confirm_dialog is None:
+            self._workspace_overwrite_confirm_dialog = ConfirmDialog(
+                title_text='Workspace exists!',
+                body_text='Overwrite files from a previous run?',
+                parent=self)
+        return self._workspace_overwrite_confirm_dialog
+
+    @property
+    def model_mismatch_confirm_dialog(self):
+        """The ``ModelMismatchConfirmDialog``, built on first access."""
+        if self._model_mismatch_confirm_dialog is None:
+            self._model_mismatch_confirm_dialog = ModelMismatchConfirmDialog(
+                self.target.__module__, parent=self)
+        return self._model_mismatch_confirm_dialog
+
     def build_open_menu(self):
         """(Re-)Build the "Open datastack" menu.
 
@@ -1354,7 +1501,7 @@ class InVESTModel(QtWidgets.QMainWindow):
         """
         self.open_menu.clear()
         self.open_file_action = self.open_menu.addAction(
-            qtawesome.icon('fa.arrow-circle-o-up'),
+            ICON_LOAD,
             'L&oad datastack, parameter set or logfile...',
             self.load_datastack,
             QtGui.QKeySequence(QtGui.QKeySequence.Open))
@@ -1462,7 +1609,8 @@ class InVESTModel(QtWidgets.QMainWindow):
         """Track Input instances in self.inputs.
 
         All local attributes will be set, but instances of ``inputs.Input``
-        will have their reference added to ``self.inputs``.
+        will have their reference added to ``self.inputs`` and registered by
+        their args key.
 
         Args:
             name (string): The string name of the local attribute being set.
@@ -1473,6 +1621,16 @@ class InVESTModel(QtWidgets.QMainWindow):
         """
         if isinstance(value, inputs.InVESTModelInput):
             self.inputs.add(value)
+            self._inputs_by_args_key[value.args_key] = value
+            if isinstance(value, inputs.GriddedInput):
+                self._gridded_inputs[value.args_key] = value
+            value.value_changed.connect(self._invalidate_args_cache)
+            if isinstance(value, inputs.Dropdown):
+                # Dropdown.set_options() adds items with the combobox's
+                # signals blocked, but its item model still reports them.
+                item_model = value.dropdown.model()
+                item_model.rowsInserted.connect(self._invalidate_args_cache)
+                item_model.modelReset.connect(self._invalidate_args_cache)
         # Python Core and Builtins were updated in Python 3.8.4
         # that handle __setattr__ differently. In 3.7, the super()
         # implementation causes a `TypeError: can't apply this __setattr__
@@ -1513,12 +1671,14 @@ class InVESTModel(QtWidgets.QMainWindow):
         if not datastack_opts:  # user pressed cancel
             return
 
-        current_args = self.assemble_args()
+        current_args = self._cached_assemble_args()
         if (not datastack_opts.include_workspace or
                 datastack_opts.datastack_type == _DATASTACK_DATA_ARCHIVE):
             del current_args['workspace_dir']
 
-        LOGGER.info('Current parameters:\n%s', pprint.pformat(current_args))
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info('Current parameters:\n%s',
+                        pprint.pformat(current_args))
 
         # if parent dir of archive_path does not exist, create it.
         archive_dir = os.path.dirname(
@@ -1552,8 +1712,7 @@ class InVESTModel(QtWidgets.QMainWindow):
             'Saved current parameters to %s' % save_filepath)
         LOGGER.info(alert_message)
         self.statusBar().showMessage(alert_message, STATUSBAR_MSG_DURATION)
-        self.window_title.set_title_attr('filename',
-                                         os.path.basename(save_filepath))
+        self.window_title.filename = os.path.basename(save_filepath)
 
     def add_input(self, input_obj):
         """Add an input to the model.
@@ -1599,6 +1758,12 @@ class InVESTModel(QtWidgets.QMainWindow):
         Returns:
             ``None``
         """
+        # Validate now if a debounced validation is still pending, so the
+        # warnings checked below reflect the current inputs.
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self.validate(block=True)
+
         args = self.assemble_args()
 
         # If we have validation warnings, show them and return to inputs.
@@ -1738,7 +1903,7 @@ class InVESTModel(QtWidgets.QMainWindow):
             raise ValueError('Unknown stack type "%s"' % stack_type)
 
         self.load_args(args)
-        self.window_title.set_title_attr('filename', window_title_filename)
+        self.window_title.filename = window_title_filename
 
         self._add_to_open_menu(datastack_path)
         self.statusBar().showMessage(
@@ -1755,19 +1920,48 @@ class InVESTModel(QtWidgets.QMainWindow):
         Returns:
             ``None``
         """
-        _inputs = dict((ui_input.args_key, ui_input) for ui_input in
-                       self.inputs)
-        LOGGER.debug(pprint.pformat(_inputs))
+        _inputs = self._inputs_by_args_key
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(pprint.pformat(_inputs))
+
+        # A loaded workspace, even a blank one, takes precedence over the
+        # default workspace.
+        if self.workspace.args_key in datastack_args:
+            self._default_workspace = None
+
+        with self.suppress_validation():
+            for args_key, args_value in datastack_args.items():
+                input_obj = _inputs.get(args_key)
+                if input_obj is None:
+                    LOGGER.warning(('Datastack args_key %s not associated '
+                                    'with any inputs'), args_key)
+                    continue
+                try:
+                    input_obj.set_value(args_value)
+                except Exception:
+                    LOGGER.exception('Error setting %s to %s', args_key,
+                                     args_value)
+
+    @contextlib.contextmanager
+    def suppress_validation(self):
+        """Context manager to coalesce whole-model validation.
+
+        While the context is active, input changes do not trigger validation.
+        If any input changed, the model is validated once on exit.
 
-        for args_key, args_value in datastack_args.items():
-            try:
-                _inputs[args_key].set_value(args_value)
-            except KeyError:
-                LOGGER.warning(('Datastack args_key %s not associated with '
-                                'any inputs'), args_key)
-            except Exception:
-                LOGGER.exception('Error setting %s to %s', args_key,
-                                 args_value)
+        Returns:
+            ``None``
+        """
+        already_suppressed = self._validation_suppressed
+        self._validation_suppressed = True
+        try:
+            yield
+        finally:
+            self._validation_suppressed = already_suppressed
+
+        if not already_suppressed and self._validation_requested:
+            self._validation_requested = False
+            self.validate(block=False)
 
     def assemble_args(self):
         """Collect arguments from the UI and assemble them into a dictionary.
@@ -1779,6 +1973,29 @@ class InVESTModel(QtWidgets.QMainWindow):
         """
         raise NotImplementedError
 
+    def _invalidate_args_cache(self, *args):
+        """Forget the cached args after an input's value changes.
+
+        Args:
+            *args: The new value emitted by the input's ``value_changed``
+                signal.  Ignored.
+
+        Returns:
+            ``None``
+        """
+        self._args_cache = None
+
+    def _cached_assemble_args(self):
+        """Get the args dict, reusing it while no input has changed.
+
+        Returns:
+            A new dict with the same contents as ``self.assemble_args()``,
+            which callers are free to modify.
+        """
+        if self._args_cache is None:
+            self._args_cache = self.assemble_args()
+        return self._args_cache.copy()
+
     @QtCore.Slot(list)
     def _validation_finished(self, validation_warnings):
         """A slot to handle whole-model validation errors.
@@ -1793,7 +2010,7 @@ class InVESTModel(QtWidgets.QMainWindow):
         LOGGER.info('Whole-model validation returned: %s',
                     validation_warnings)
         if validation_warnings:
-            icon = qtawesome.icon('fa.times', color='red')
+            icon = ICON_INVALID
         else:
             icon = inputs.ICON_ENTER
         self.form.run_button.setIcon(icon)
@@ -1802,10 +2019,7 @@ class InVESTModel(QtWidgets.QMainWindow):
         # error only affects that one input.
         # We can only post validation warnings if the input supports it (is a
         # GriddedInput instance).
-        args_to_inputs = {}
-        for input_ in self.inputs:
-            if isinstance(input_, inputs.GriddedInput):
-                args_to_inputs[input_.args_key] = input_
+        args_to_inputs = self._gridded_inputs
 
         warnings_ = []
         for keys, warning in validation_warnings:
@@ -1852,7 +2066,11 @@ class InVESTModel(QtWidgets.QMainWindow):
         # model-wide validation slot.
         def _validate(new_value):
             # We want to validate the whole form; discard the individual value
-            self.validate(block=False)
+            if self._validation_suppressed:
+                self._validation_requested = True
+                return
+            # Restarting an active single-shot timer postpones it.
+            self._validate_timer.start()
         
         # Set up quickrun options if we're doing a quickrun
         if quickrun:
@@ -1927,6 +2145,23 @@ class InVESTModel(QtWidgets.QMainWindow):
         self.prompt_on_close = prompt
         QtWidgets.QMainWindow.close(self)
 
+    def showEvent(self, showEvent):
+        """Set the default workspace the first time the window is shown.
+
+        Reimplemented from QMainWindow.showEvent.
+
+        Args:
+            showEvent (QEvent): The current showEvent.
+
+        Returns:
+            ``None``
+        """
+        if self._default_workspace is not None:
+            if not self.workspace.value():
+                self.workspace.set_value(self._default_workspace)
+            self._default_workspace = None
+        QtWidgets.QMainWindow.showEvent(self, showEvent)
+
     def closeEvent(self, event):
         """Handle close events for the QMainWindow.
 
@@ -2008,7 +2243,7 @@ class InVESTModel(QtWidgets.QMainWindow):
 
         self.statusBar().showMessage('Loaded parameters from previous run.',
                                      STATUSBAR_MSG_DURATION)
-        self.window_title.set_title_attr('filename', 'loaded from autosave')
+        self.window_title.filename = 'loaded from autosave'
 
     def dragEnterEvent(self, event):
         """Handle the event where something has been dragged into the window.
@@ -71,6 +71,37 @@ N_WORKERS_SPEC = {
 }
 
 
+# __builtins__ can be either a dict or a module.  We need its contents as a
+# dict in order to use ``eval``.
+if not isinstance(__builtins__, dict):
+    _BUILTINS = __builtins__.__dict__
+else:
+    _BUILTINS = __builtins__
+_BUILTIN_SYMBOLS = frozenset(_BUILTINS.keys())
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_expression(expression):
+    """Parse and compile a python expression.
+
+    Expressions come from the ``ARGS_SPEC`` of each model and are evaluated
+    on every validation pass, so each one is only compiled once.
+
+    Args:
+        expression (string): A string expression that returns a value.
+
+    Returns:
+        A 2-tuple of the compiled code object and a frozenset of the
+        identifiers used in the expression.
+
+    """
+    tree = ast.parse(expression, mode='eval')
+    active_symbols = frozenset(
+        tree_node.id for tree_node in ast.walk(tree)
+        if isinstance(tree_node, ast.Name))
+    return compile(tree, '<expression>', 'eval'), active_symbols
+
+
 def _evaluate_expression(expression, variable_map):
     """Evaluate a python expression.
 
@@ -87,23 +118,12 @@ def _evaluate_expression(expression, variable_map):
         variables stored in ``variable_map``.
 
     """
-    # __builtins__ can be either a dict or a module.  We need its contents as a
-    # dict in order to use ``eval``.
-    if not isinstance(__builtins__, dict):
-        builtins = __builtins__.__dict__
-    else:
-        builtins = __builtins__
-    builtin_symbols = set(builtins.keys())
-
-    active_symbols = set()
-    for tree_node in ast.walk(ast.parse(expression)):
-        if isinstance(tree_node, ast.Name):
-            active_symbols.add(tree_node.id)
+    code, active_symbols = _compile_expression(expression)
 
     # This should allow any builtin functions, exceptions, etc. to be handled
     # correctly within an expression.
     missing_symbols = (active_symbols -
-                       set(variable_map.keys()).union(builtin_symbols))
+                       _BUILTIN_SYMBOLS.union(variable_map.keys()))
     if missing_symbols:
         raise AssertionError(
             'Identifiers expected in the expression "%s" are missing: %s' % (
@@ -111,7 +131,7 @@ def _evaluate_expression(expression, variable_map):
 
     # The usual warnings should go with this call to eval:
     # Don't run untrusted code!!!
-    return eval(expression, builtins, variable_map)
+    return eval(code, _BUILTINS, variable_map)
 
 
 def get_invalid_keys(validation_warnings):
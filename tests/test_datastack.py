@@ -2,6 +2,7 @@
 import os
 import sys
 import unittest
+import unittest.mock
 import tempfile
 import shutil
 import json
@@ -55,6 +56,32 @@ class DatastacksTest(unittest.TestCase):
                              datastack.DATASTACK_PARAMETER_FILENAME)))['args'],
             {'a': 1, 'b': 'hello there', 'c': 'plain bytestring', 'd': ''})
 
+    def test_failed_write_keeps_existing_archive(self):
+        """Datastack: a failed archive write leaves the old datastack."""
+        from natcap.invest import datastack
+
+        archive_path = os.path.join(self.workspace, 'archive.invs.tar.gz')
+        datastack.build_datastack_archive({'a': 1}, 'sample_model',
+                                          archive_path)
+        with open(archive_path, 'rb') as archive:
+            original_bytes = archive.read()
+
+        def _partial_write(source_dir, target_path):
+            with open(target_path, 'wb') as target:
+                target.write(b'truncated')
+            raise IOError('disk full')
+
+        with unittest.mock.patch(
+                'natcap.invest.datastack._write_archive', _partial_write):
+            with self.assertRaises(IOError):
+                datastack.build_datastack_archive(
+                    {'a': 2}, 'sample_model', archive_path)
+
+        with open(archive_path, 'rb') as archive:
+            self.assertEqual(archive.read(), original_bytes)
+        self.assertEqual(os.listdir(self.workspace),
+                         ['archive.invs.tar.gz'])
+
     def test_collect_multipart_gdal_raster(self):
         """Datastack: test collect multipart gdal raster."""
         from natcap.invest import datastack
@@ -781,6 +808,75 @@ class DatastacksTest(unittest.TestCase):
         self.assertEqual(extracted_args, expected_args)
 
 
+class ArchiveWriterTest(unittest.TestCase):
+    """Test each of the datastack archive writers."""
+    def setUp(self):
+        """Create temporary workspace."""
+        self.workspace = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove temporary workspace."""
+        shutil.rmtree(self.workspace)
+
+    def _assert_archive_round_trip(self):
+        """Build an archive, then check its member order and contents."""
+        from natcap.invest import datastack
+
+        table_path = os.path.join(self.workspace, 'table.csv')
+        with open(table_path, 'w') as table:
+            table.write('lucode,value\n1,2\n')
+        params = {'a': 1, 'table': table_path}
+
+        archive_path = os.path.join(self.workspace, 'archive.invs.tar.gz')
+        datastack.build_datastack_archive(params, 'sample_model',
+                                          archive_path)
+
+        with tarfile.open(archive_path) as tar:
+            member_names = tar.getnames()
+        self.assertEqual(member_names[0], './parameters.invest.json')
+        self.assertFalse(
+            [name for name in member_names
+             if os.path.basename(name).startswith('._')])
+
+        dest_dir = os.path.join(self.workspace, 'extracted_archive')
+        archived_params = datastack.extract_datastack_archive(
+            archive_path, dest_dir)
+        self.assertEqual(archived_params['a'], 1)
+        self.assertTrue(filecmp.cmp(table_path, archived_params['table'],
+                                    shallow=False))
+
+    @unittest.skipIf(sys.platform.startswith('win'),
+                     'fake pigz is a shell script')
+    def test_tar_and_pigz(self):
+        """Datastack: archive written by tar piped into pigz."""
+        tar_path = shutil.which('tar')
+        gzip_path = shutil.which('gzip')
+        if not (tar_path and gzip_path):
+            self.skipTest('tar and gzip are required')
+
+        # Stand in for pigz (which might not be installed) with gzip, while
+        # checking that a thread count is passed.
+        fake_pigz_path = os.path.join(self.workspace, 'pigz')
+        with open(fake_pigz_path, 'w') as fake_pigz:
+            fake_pigz.write(textwrap.dedent(f"""\
+                #!/bin/sh
+                [ "$1" = "-p" ] && [ "$2" -ge 1 ] || exit 2
+                exec {gzip_path} -c
+                """))
+        os.chmod(fake_pigz_path, 0o755)
+
+        with unittest.mock.patch(
+                'natcap.invest.datastack._TAR_PATH', tar_path), \
+                unittest.mock.patch(
+                    'natcap.invest.datastack._PIGZ_PATH', fake_pigz_path):
+            self._assert_archive_round_trip()
+
+    def test_tarfile(self):
+        """Datastack: archive written by tarfile alone."""
+        with unittest.mock.patch('natcap.invest.datastack._TAR_PATH', None):
+            self._assert_archive_round_trip()
+
+
 class UtilitiesTest(unittest.TestCase):
     """Datastack Utilities Tests."""
     def test_print_args(self):
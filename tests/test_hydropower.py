@@ -3,17 +3,61 @@ import unittest
 import tempfile
 import shutil
 import os
+import itertools
 
 import pandas
 import numpy
 import pygeoprocessing
 
+from natcap.invest import utils
+from natcap.invest.hydropower import hydropower_water_yield
+
 SAMPLE_DATA = os.path.join(
     os.path.dirname(__file__), '..', 'data', 'invest-test-data', 'hydropower',
     'input')
 REGRESSION_DATA = os.path.join(
     os.path.dirname(__file__), '..', 'data', 'invest-test-data', 'hydropower')
 
+# Output files compared against the regression data in the component tests.
+RASTER_RESULTS = ('aet.tif', 'fractp.tif', 'wyield.tif')
+VECTOR_RESULTS = (
+    'watershed_results_wyield.shp', 'subwatershed_results_wyield.shp')
+TABLE_RESULTS = (
+    'watershed_results_wyield.csv', 'subwatershed_results_wyield.csv')
+
+# Args shared by every regression test, less the per-test workspace.
+BASE_ARGS = {
+    'lulc_path': os.path.join(SAMPLE_DATA, 'lulc.tif'),
+    'depth_to_root_rest_layer_path': os.path.join(
+        SAMPLE_DATA,
+        'depth_to_root_rest_layer.tif'),
+    'precipitation_path': os.path.join(SAMPLE_DATA, 'precip.tif'),
+    'pawc_path': os.path.join(SAMPLE_DATA, 'pawc.tif'),
+    'eto_path': os.path.join(SAMPLE_DATA, 'eto.tif'),
+    'watersheds_path': os.path.join(SAMPLE_DATA, 'watersheds.shp'),
+    'biophysical_table_path': os.path.join(
+        SAMPLE_DATA, 'biophysical_table.csv'),
+    'seasonality_constant': 5,
+    'n_workers': -1,
+}
+
+
+def _copy_table_head(source_table_path, target_table_path, n_lines=2):
+    """Copy the first ``n_lines`` lines of a table to a new file.
+
+    Args:
+        source_table_path (string): path to the table to copy from.
+        target_table_path (string): path to the truncated table to write.
+        n_lines (int): the number of lines, including the header, to keep.
+
+    Returns:
+        None
+    """
+    with open(source_table_path, 'rb') as source_table_file:
+        with open(target_table_path, 'wb') as target_table_file:
+            target_table_file.writelines(
+                itertools.islice(source_table_file, n_lines))
+
 
 class HydropowerTests(unittest.TestCase):
     """Regression Tests for Annual Water Yield Hydropower Model."""
@@ -31,27 +75,54 @@ class HydropowerTests(unittest.TestCase):
     @staticmethod
     def generate_base_args(workspace_dir):
         """Generate an args list that is consistent across regression tests."""
-        args = {
-            'workspace_dir': workspace_dir,
-            'lulc_path': os.path.join(SAMPLE_DATA, 'lulc.tif'),
-            'depth_to_root_rest_layer_path': os.path.join(
-                SAMPLE_DATA,
-                'depth_to_root_rest_layer.tif'),
-            'precipitation_path': os.path.join(SAMPLE_DATA, 'precip.tif'),
-            'pawc_path': os.path.join(SAMPLE_DATA, 'pawc.tif'),
-            'eto_path': os.path.join(SAMPLE_DATA, 'eto.tif'),
-            'watersheds_path': os.path.join(SAMPLE_DATA, 'watersheds.shp'),
-            'biophysical_table_path': os.path.join(
-                SAMPLE_DATA, 'biophysical_table.csv'),
-            'seasonality_constant': 5,
-            'n_workers': -1,
-        }
+        args = BASE_ARGS.copy()
+        args['workspace_dir'] = workspace_dir
         return args
 
+    @staticmethod
+    def assert_regression_outputs(workspace_dir, component, suffix=''):
+        """Assert model outputs match the regression data for a component.
+
+        Args:
+            workspace_dir (string): the workspace the model was executed in.
+            component (string): the subdirectory of ``REGRESSION_DATA`` that
+                holds the expected vectors and tables, one of
+                ``'water_yield'``, ``'scarcity'`` or ``'valuation'``.
+            suffix (string): the file suffix the model was executed with,
+                without the leading underscore.
+
+        Returns:
+            None
+        """
+        def _suffixed(path):
+            if not suffix:
+                return path
+            base, ext = os.path.splitext(path)
+            return '%s_%s%s' % (base, suffix, ext)
+
+        for raster_path in RASTER_RESULTS:
+            model_array = pygeoprocessing.raster_to_numpy_array(
+                os.path.join(
+                    workspace_dir, 'output', 'per_pixel',
+                    _suffixed(raster_path)))
+            reg_array = pygeoprocessing.raster_to_numpy_array(
+                os.path.join(REGRESSION_DATA, raster_path))
+            numpy.testing.assert_allclose(model_array, reg_array, rtol=1e-03)
+
+        for vector_path in VECTOR_RESULTS:
+            utils._assert_vectors_equal(
+                os.path.join(workspace_dir, 'output', _suffixed(vector_path)),
+                os.path.join(REGRESSION_DATA, component, vector_path))
+
+        for table_path in TABLE_RESULTS:
+            base_table = pandas.read_csv(
+                os.path.join(workspace_dir, 'output', _suffixed(table_path)))
+            expected_table = pandas.read_csv(
+                os.path.join(REGRESSION_DATA, component, table_path))
+            pandas.testing.assert_frame_equal(base_table, expected_table)
+
     def test_invalid_lulc_veg(self):
         """Hydro: catching invalid LULC_veg values."""
-        from natcap.invest.hydropower import hydropower_water_yield
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
 
         new_lulc_veg_path = os.path.join(self.workspace_dir,
@@ -77,8 +148,6 @@ class HydropowerTests(unittest.TestCase):
     
     def test_missing_lulc_value(self):
         """Hydro: catching missing LULC value in Biophysical table."""
-        from natcap.invest.hydropower import hydropower_water_yield
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
 
         # remove a row from the biophysical table so that lulc value is missing
@@ -100,8 +169,6 @@ class HydropowerTests(unittest.TestCase):
     
     def test_missing_lulc_demand_value(self):
         """Hydro: catching missing LULC value in Demand table."""
-        from natcap.invest.hydropower import hydropower_water_yield
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
         
         args['demand_table_path'] = os.path.join(
@@ -128,50 +195,17 @@ class HydropowerTests(unittest.TestCase):
 
     def test_water_yield_subshed(self):
         """Hydro: testing water yield component only w/ subwatershed."""
-        from natcap.invest.hydropower import hydropower_water_yield
-        from natcap.invest import utils
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
         args['sub_watersheds_path'] = os.path.join(
             SAMPLE_DATA, 'subwatersheds.shp')
         args['results_suffix'] = 'test'
         hydropower_water_yield.execute(args)
 
-        raster_results = ['aet_test.tif', 'fractp_test.tif', 'wyield_test.tif']
-        for raster_path in raster_results:
-            model_array = pygeoprocessing.raster_to_numpy_array(
-                os.path.join(
-                    args['workspace_dir'], 'output', 'per_pixel', raster_path))
-            reg_array = pygeoprocessing.raster_to_numpy_array(
-                os.path.join(
-                    REGRESSION_DATA, raster_path.replace('_test', '')))
-            numpy.testing.assert_allclose(model_array, reg_array, rtol=1e-03)
-
-        vector_results = ['watershed_results_wyield_test.shp',
-                          'subwatershed_results_wyield_test.shp']
-        for vector_path in vector_results:
-            utils._assert_vectors_equal(
-                os.path.join(args['workspace_dir'], 'output', vector_path),
-                os.path.join(
-                    REGRESSION_DATA, 'water_yield', vector_path.replace(
-                        '_test', '')))
-
-        table_results = ['watershed_results_wyield_test.csv',
-                         'subwatershed_results_wyield_test.csv']
-        for table_path in table_results:
-            base_table = pandas.read_csv(
-                os.path.join(args['workspace_dir'], 'output', table_path))
-            expected_table = pandas.read_csv(
-                os.path.join(
-                    REGRESSION_DATA, 'water_yield',
-                    table_path.replace('_test', '')))
-            pandas.testing.assert_frame_equal(base_table, expected_table)
+        HydropowerTests.assert_regression_outputs(
+            args['workspace_dir'], 'water_yield', suffix='test')
 
     def test_scarcity_subshed(self):
         """Hydro: testing Scarcity component w/ subwatershed."""
-        from natcap.invest.hydropower import hydropower_water_yield
-        from natcap.invest import utils
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
         args['demand_table_path'] = os.path.join(
             SAMPLE_DATA, 'water_demand_table.csv')
@@ -180,36 +214,11 @@ class HydropowerTests(unittest.TestCase):
 
         hydropower_water_yield.execute(args)
 
-        raster_results = ['aet.tif', 'fractp.tif', 'wyield.tif']
-        for raster_path in raster_results:
-            model_array = pygeoprocessing.raster_to_numpy_array(
-                os.path.join(
-                    args['workspace_dir'], 'output', 'per_pixel', raster_path))
-            reg_array = pygeoprocessing.raster_to_numpy_array(
-                os.path.join(REGRESSION_DATA, raster_path))
-            numpy.testing.assert_allclose(model_array, reg_array, rtol=1e-03)
-
-        vector_results = ['watershed_results_wyield.shp',
-                          'subwatershed_results_wyield.shp']
-        for vector_path in vector_results:
-            utils._assert_vectors_equal(
-                os.path.join(args['workspace_dir'], 'output', vector_path),
-                os.path.join(REGRESSION_DATA, 'scarcity', vector_path))
-
-        table_results = ['watershed_results_wyield.csv',
-                         'subwatershed_results_wyield.csv']
-        for table_path in table_results:
-            base_table = pandas.read_csv(
-                os.path.join(args['workspace_dir'], 'output', table_path))
-            expected_table = pandas.read_csv(
-                os.path.join(REGRESSION_DATA, 'scarcity', table_path))
-            pandas.testing.assert_frame_equal(base_table, expected_table)
+        HydropowerTests.assert_regression_outputs(
+            args['workspace_dir'], 'scarcity')
 
     def test_valuation_subshed(self):
         """Hydro: testing Valuation component w/ subwatershed."""
-        from natcap.invest.hydropower import hydropower_water_yield
-        from natcap.invest import utils
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
         args['demand_table_path'] = os.path.join(
             SAMPLE_DATA, 'water_demand_table.csv')
@@ -220,35 +229,11 @@ class HydropowerTests(unittest.TestCase):
 
         hydropower_water_yield.execute(args)
 
-        raster_results = ['aet.tif', 'fractp.tif', 'wyield.tif']
-        for raster_path in raster_results:
-            model_array = pygeoprocessing.raster_to_numpy_array(
-                os.path.join(
-                    args['workspace_dir'], 'output', 'per_pixel', raster_path))
-            reg_array = pygeoprocessing.raster_to_numpy_array(
-                os.path.join(REGRESSION_DATA, raster_path))
-            numpy.testing.assert_allclose(model_array, reg_array, 1e-03)
-
-        vector_results = ['watershed_results_wyield.shp',
-                          'subwatershed_results_wyield.shp']
-        for vector_path in vector_results:
-            utils._assert_vectors_equal(
-                os.path.join(args['workspace_dir'], 'output', vector_path),
-                os.path.join(REGRESSION_DATA, 'valuation', vector_path))
-
-        table_results = ['watershed_results_wyield.csv',
-                         'subwatershed_results_wyield.csv']
-        for table_path in table_results:
-            base_table = pandas.read_csv(
-                os.path.join(args['workspace_dir'], 'output', table_path))
-            expected_table = pandas.read_csv(
-                os.path.join(REGRESSION_DATA, 'valuation', table_path))
-            pandas.testing.assert_frame_equal(base_table, expected_table)
+        HydropowerTests.assert_regression_outputs(
+            args['workspace_dir'], 'valuation')
 
     def test_validation(self):
         """Hydro: test failure cases on the validation function."""
-        from natcap.invest.hydropower import hydropower_water_yield
-
         args = HydropowerTests.generate_base_args(self.workspace_dir)
 
         # default args should be fine
@@ -284,15 +269,8 @@ class HydropowerTests(unittest.TestCase):
         args_bad_biophysical_table = args.copy()
         bad_biophysical_path = os.path.join(
             self.workspace_dir, 'bad_biophysical_table.csv')
-        with open(bad_biophysical_path, 'wb') as bad_biophysical_file:
-            with open(args['biophysical_table_path'], 'rb') as (
-                    biophysical_table_file):
-                lines_to_write = 2
-                for line in biophysical_table_file.readlines():
-                    bad_biophysical_file.write(line)
-                    lines_to_write -= 1
-                    if lines_to_write == 0:
-                        break
+        _copy_table_head(
+            args['biophysical_table_path'], bad_biophysical_path)
         args_bad_biophysical_table['biophysical_table_path'] = (
             bad_biophysical_path)
         with self.assertRaises(ValueError) as cm:
@@ -304,33 +282,14 @@ class HydropowerTests(unittest.TestCase):
 
         # ensure that a missing landcover code in the demand table will
         # raise an exception that's helpful
-        args_bad_biophysical_table = args.copy()
-        bad_biophysical_path = os.path.join(
-            self.workspace_dir, 'bad_biophysical_table.csv')
-        with open(bad_biophysical_path, 'wb') as bad_biophysical_file:
-            with open(args['biophysical_table_path'], 'rb') as (
-                    biophysical_table_file):
-                lines_to_write = 2
-                for line in biophysical_table_file.readlines():
-                    bad_biophysical_file.write(line)
-                    lines_to_write -= 1
-                    if lines_to_write == 0:
-                        break
         args_bad_demand_table = args.copy()
         bad_demand_path = os.path.join(
             self.workspace_dir, 'bad_demand_table.csv')
         args_bad_demand_table['demand_table_path'] = (
             bad_demand_path)
-        with open(bad_demand_path, 'wb') as bad_demand_file:
-            with open(os.path.join(
-                SAMPLE_DATA, 'water_demand_table.csv'), 'rb') as (
-                    demand_table_file):
-                lines_to_write = 2
-                for line in demand_table_file.readlines():
-                    bad_demand_file.write(line)
-                    lines_to_write -= 1
-                    if lines_to_write == 0:
-                        break
+        _copy_table_head(
+            os.path.join(SAMPLE_DATA, 'water_demand_table.csv'),
+            bad_demand_path)
 
         # ensure that a missing watershed id the valuation table will
         # raise an exception that's helpful
@@ -350,16 +309,9 @@ class HydropowerTests(unittest.TestCase):
         args_bad_valuation_table['demand_table_path'] = os.path.join(
             SAMPLE_DATA, 'water_demand_table.csv')
 
-        with open(bad_valuation_path, 'wb') as bad_valuation_file:
-            with open(os.path.join(
-                SAMPLE_DATA, 'hydropower_valuation_table.csv'), 'rb') as (
-                    valuation_table_file):
-                lines_to_write = 2
-                for line in valuation_table_file.readlines():
-                    bad_valuation_file.write(line)
-                    lines_to_write -= 1
-                    if lines_to_write == 0:
-                        break
+        _copy_table_head(
+            os.path.join(SAMPLE_DATA, 'hydropower_valuation_table.csv'),
+            bad_valuation_path)
 
         with self.assertRaises(ValueError) as cm:
             hydropower_water_yield.execute(args_bad_valuation_table)
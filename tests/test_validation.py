@@ -92,6 +92,49 @@ class SpatialOverlapTest(unittest.TestCase):
         expected = f'Spatial file {filepath_2} has no projection'
         self.assertEqual(error_msg, expected)
 
+    def test_check_overlap_projection_added(self):
+        """Validation: a sidecar .prj added between validations is seen."""
+        from natcap.invest import validation
+
+        driver = gdal.GetDriverByName('GTiff')
+        raster_path = os.path.join(self.workspace_dir, 'raster.tif')
+        vector_path = os.path.join(self.workspace_dir, 'vector.shp')
+
+        wgs84_srs = osr.SpatialReference()
+        wgs84_srs.ImportFromEPSG(4326)
+        raster = driver.Create(raster_path, 3, 3, 1, gdal.GDT_Int32)
+        raster.SetProjection(wgs84_srs.ExportToWkt())
+        raster.SetGeoTransform([1, 1, 0, 1, 0, 1])
+        raster = None
+
+        # set up a shapefile without a .prj file
+        vector_driver = ogr.GetDriverByName('ESRI Shapefile')
+        vector = vector_driver.CreateDataSource(vector_path)
+        layer = vector.CreateLayer('vector', None, ogr.wkbPolygon)
+        feature = ogr.Feature(layer.GetLayerDefn())
+        feature.SetGeometry(ogr.CreateGeometryFromWkt(
+            'POLYGON ((2 2, 2 3, 3 3, 3 2, 2 2))'))
+        layer.CreateFeature(feature)
+        feature = None
+        layer = None
+        vector = None
+
+        error_msg = validation.check_spatial_overlap(
+            [raster_path, vector_path], different_projections_ok=True)
+        self.assertEqual(
+            error_msg, f'Spatial file {vector_path} has no projection')
+
+        # the .prj sidecar doesn't change the .shp, so validation must not
+        # rely on anything keyed on the main file alone.
+        wgs84_srs.MorphToESRI()
+        with open(os.path.join(self.workspace_dir, 'vector.prj'), 'w') as prj:
+            prj.write(wgs84_srs.ExportToWkt())
+
+        self.assertEqual(
+            validation.check_spatial_overlap(
+                [raster_path, vector_path], different_projections_ok=True),
+            None)
+
     @unittest.skip("skipping due to unresolved projection comparison question")
     def test_different_projections_not_ok(self):
         """Validation: different projections not allowed by default.
@@ -2092,6 +2092,129 @@ class ModelTests(_QtTest):
             model_ui.close(prompt=False)
             model_ui.destroy()
 
+    def test_default_workspace_on_show(self):
+        """UI Model: The default workspace is set when the window is shown."""
+        from natcap.invest.ui import model
+
+        model_ui = ModelTests.build_model()
+        try:
+            self.assertEqual(model_ui.workspace.value(), '')
+            model_ui.run()
+            self.assertEqual(
+                model_ui.workspace.value(),
+                os.path.normpath(os.path.join(
+                    model._DOCUMENTS_DIR, '%s_workspace' % (
+                        ModelTests.__module__.split('.')[-1]))))
+        finally:
+            model_ui.close(prompt=False)
+            model_ui.destroy()
+
+    def test_lastrun_blank_workspace_kept(self):
+        """UI Model: A blank workspace from the last run is not defaulted."""
+        model_ui = ModelTests.build_model()
+        try:
+            model_ui.suffix.set_value('foo')
+            model_ui.save_lastrun()
+
+            model_ui.run()
+            self.assertEqual(model_ui.suffix.value(), 'foo')
+            self.assertEqual(model_ui.workspace.value(), '')
+        finally:
+            model_ui.close(prompt=False)
+            model_ui.destroy()
+
+    def test_cached_args_dropdown_set_options(self):
+        """UI Model: Cached args follow options added to an empty dropdown."""
+        from natcap.invest.ui import inputs
+
+        model_ui = ModelTests.build_model()
+        try:
+            model_ui.dropdown = inputs.Dropdown(
+                label='Dropdown', args_key='dropdown', options=())
+            model_ui.add_input(model_ui.dropdown)
+            model_ui.assemble_args = lambda: {
+                'dropdown': model_ui.dropdown.value()}
+
+            self.assertEqual(model_ui._cached_assemble_args(),
+                             {'dropdown': ''})
+
+            model_ui.dropdown.set_options(('foo', 'bar'))
+            self.assertEqual(model_ui._cached_assemble_args(),
+                             {'dropdown': 'foo'})
+        finally:
+            model_ui.close(prompt=False)
+            model_ui.destroy()
+
+    def test_load_args_validates_once(self):
+        """UI Model: Loading several args triggers a single validation."""
+        model_ui = ModelTests.build_model()
+        try:
+            model_ui.run()
+            with mock.patch.object(model_ui, 'validate') as validate:
+                model_ui.load_args({
+                    'workspace_dir': os.path.join(self.workspace, 'foo'),
+                    'results_suffix': 'bar',
+                })
+                self.assertEqual(model_ui.suffix.value(), 'bar')
+                validate.assert_called_once_with(block=False)
+                self.assertFalse(model_ui._validate_timer.isActive())
+        finally:
+            model_ui.close(prompt=False)
+            model_ui.destroy()
+
+    def test_validation_debounced(self):
+        """UI Model: A burst of input changes is validated once."""
+        model_ui = ModelTests.build_model()
+        try:
+            model_ui.run()
+            with mock.patch.object(model_ui, 'validate') as validate:
+                for suffix in ('a', 'ab', 'abc'):
+                    model_ui.suffix.set_value(suffix)
+                validate.assert_not_called()
+                self.assertTrue(model_ui._validate_timer.isActive())
+
+                QTest.qWait(model_ui._validate_timer.interval() * 3)
+                validate.assert_called_once_with(block=False)
+        finally:
+            model_ui.close(prompt=False)
+            model_ui.destroy()
+
+    def test_execute_model_flushes_pending_validation(self):
+        """UI Model: Executing validates pending input changes first."""
+        from natcap.invest import validation
+
+        @validation.invest_validator
+        def _validate(args, limit_to=None):
+            if args['results_suffix'] == 'invalid':
+                return [(['results_suffix'], 'Invalid suffix')]
+            return []
+
+        target_func = mock.Mock()
+        model_ui = ModelTests.build_model(validate_func=_validate,
+                                          target_func=target_func)
+        try:
+            model_ui.run()
+            self.assertFalse(model_ui.validation_report_dialog.warnings)
+
+            # The debounced validation hasn't happened yet.
+            model_ui.suffix.set_value('invalid')
+            self.assertTrue(model_ui._validate_timer.isActive())
+            self.assertFalse(model_ui.validation_report_dialog.warnings)
+
+            with mock.patch.object(model_ui.validation_report_dialog,
+                                   'show'), \
+                    mock.patch.object(model_ui.validation_report_dialog,
+                                      'exec_') as exec_:
+                model_ui.execute_model()
+                exec_.assert_called_once()
+
+            self.assertFalse(model_ui._validate_timer.isActive())
+            self.assertTrue(model_ui.validation_report_dialog.warnings)
+            target_func.assert_not_called()
+        finally:
+            model_ui.close(prompt=False)
+            model_ui.destroy()
+
     def test_close_window_confirm(self):
         """UI Model: Close confirmation dialog 'remember lastrun' checkbox."""
         model_ui = ModelTests.build_model()